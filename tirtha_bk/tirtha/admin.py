@@ -1,24 +1,271 @@
+from functools import lru_cache
+
 from django.contrib import admin, messages
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.forms.models import BaseInlineFormSet
 from django.urls import reverse
-from django.utils.html import mark_safe
-from django.utils.translation import ngettext
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from django.utils.translation import ngettext_lazy
+
+from .models import (
+    ARK,
+    Contribution,
+    Contributor,
+    Image,
+    Mesh,
+    Run,
+    refresh_count_caches,
+)
+
+PK_PLACEHOLDER = "__pk__"
+
+
+@lru_cache(maxsize=None)
+def _reverse_once(viewname, *args):
+    return reverse(viewname, args=args)
+
+
+def admin_url(viewname, pk=None):
+    """
+    Returns the URL of an admin view, reversing it only once per view.
+    For views that take an object ID, the ID is substituted into the cached URL,
+    instead of walking the URL resolver for each row.
+
+    """
+    if pk is None:
+        return _reverse_once(viewname)
+    return _reverse_once(viewname, PK_PLACEHOLDER).replace(PK_PLACEHOLDER, str(pk))
+
+
+def img_tag(url, alt=""):
+    """
+    Lazily loaded preview, so that only the rows scrolled into view are fetched.
+
+    """
+    return format_html(
+        '<img src="{}" alt="{}" style="width: 400px; height: 400px" '
+        'loading="lazy" decoding="async">',
+        url,
+        alt,
+    )
+
+
+def bulk_update_action(name, description, message, update=None, **fields):
+    """
+    Builds an admin action that sets `fields` on the selected objects, using a single
+    `UPDATE`, & reports `message % <n>` to the user.
+    `message` is an `ngettext_lazy()` string, so that it can still be translated.
+    `update(modeladmin, queryset, **fields)` replaces `queryset.update()`, if given.
+
+    """
+
+    @admin.action(description=description)
+    def action(modeladmin, request, queryset):
+        if update is None:
+            updated = queryset.update(**fields)
+        else:
+            updated = update(modeladmin, queryset, **fields)
+
+        modeladmin.message_user(request, message % updated, messages.SUCCESS)
+
+    action.__name__ = name
+    return action
+
+
+class ApproxCountPaginator(Paginator):
+    """
+    Paginator for large tables that avoids a full `COUNT(*)` on unfiltered
+    changelists, using Postgres' planner estimate instead.
+    Falls back to the exact count when filters / search are active, on other
+    databases or when the table is small enough for the estimate to be off.
+
+    """
+
+    exact_count_below = 10000
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        connection = connections[qs.db]
+        if connection.vendor == "postgresql" and not qs.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    # NOTE: regclass resolves the name via search_path, like the ORM
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(qs.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            # NOTE: reltuples is -1 (or 0) for tables that were never analyzed
+            if row and row[0] >= self.exact_count_below:
+                return int(row[0])
+        return super().count
+
+
+class OnlyFieldsChangeList(ChangeList):
+    """
+    Changelist that loads only the model admin's `list_only_fields`, so that
+    large columns (descriptions, metadata, etc.) are not fetched for each row.
+    NOTE: Kept out of `get_queryset`, since the change view saves the object
+    it loads & deferred fields would be fetched one query at a time there.
+    Likewise, only `list_select_related` is joined here, & not the relations
+    that `get_queryset` joins for the change view.
+
+    """
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if isinstance(self.list_select_related, (list, tuple)):
+            qs = qs.select_related(None).select_related(*self.list_select_related)
+        only_fields = getattr(self.model_admin, "list_only_fields", None)
+        if only_fields:
+            qs = qs.only(*only_fields)
+        return qs
+
 
-from .models import ARK, Contribution, Contributor, Image, Mesh, Run
+CURSOR_VAR = "after"
+
+
+class KeysetChangeList(OnlyFieldsChangeList):
+    """
+    Changelist that also supports keyset pagination on the default
+    `(-created_at, -pk)` ordering, via `?after=<created_at>|<pk>`.
+    Unlike `?p=`, this seeks past the earlier rows using the index, instead of
+    `OFFSET`ing & counting them, so deep pages are as fast as the first one.
+    See `templates/admin/tirtha/image/change_list.html` for the "Next" link.
+
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # NOTE: Filter / sort links start over from the first page
+        return super().get_query_string(new_params, [*(remove or []), CURSOR_VAR])
+
+    def get_cursor(self):
+        value = self.params.get(CURSOR_VAR)
+        if value is None or ORDER_VAR in self.params:
+            return None
+
+        created_at, _, pk = value.partition("|")
+        created_at = parse_datetime(created_at)
+        if created_at is None:
+            raise IncorrectLookupParameters
+        try:
+            pk = self.lookup_opts.pk.to_python(pk)
+        except ValidationError:
+            raise IncorrectLookupParameters
+        return created_at, pk
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        self.cursor = self.get_cursor()
+        if self.cursor is not None:
+            created_at, pk = self.cursor
+            # NOTE: The `lte` bound lets the index seek straight to the cursor;
+            # the OR alone is only applied as a filter over the scanned rows
+            qs = qs.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(pk__lt=pk)
+            )
+        return qs
+
+    def get_results(self, request):
+        if self.cursor is None:
+            super().get_results(request)
+            rows = list(self.result_list)
+            has_next = (
+                self.multi_page
+                and not self.show_all
+                and ORDER_VAR not in self.params
+                and len(rows) == self.list_per_page
+                and self.page_num < self.paginator.num_pages
+            )
+        else:
+            # NOTE: No COUNT & no OFFSET - one extra row tells if there is a next page
+            rows = list(self.queryset[: self.list_per_page + 1])
+            has_next = len(rows) > self.list_per_page
+            rows = rows[: self.list_per_page]
+
+            self.result_count = len(rows)
+            self.show_full_result_count = False
+            self.show_admin_actions = True
+            self.full_result_count = None
+            self.result_list = rows
+            self.can_show_all = False
+            self.multi_page = False
+            self.paginator = Paginator(rows, self.list_per_page)
+
+        self.next_cursor_url = None
+        if has_next:
+            last = rows[-1]
+            self.next_cursor_url = self.get_query_string(
+                {
+                    CURSOR_VAR: f"{last.created_at.isoformat()}|{last.pk}",
+                    PAGE_VAR: None,
+                }
+            )
+
+
+class OnlyFieldsAdmin(admin.ModelAdmin):
+    list_only_fields = None
+
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+
+
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that only shows the first `limit` related objects, to keep
+    change pages of objects with many related objects light.
+    NOTE: Link to the filtered changelist for the rest (see `contributions_link`).
+
+    """
+
+    limit = 50
+
+    def get_queryset(self):
+        # NOTE: Cached, so the slice is evaluated once for all the forms
+        if not hasattr(self, "_limited_queryset"):
+            self._limited_queryset = super().get_queryset()[: self.limit]
+        return self._limited_queryset
+
+
+def contributions_link(lookup, obj, count):
+    """
+    Links to the Contribution changelist, filtered on `lookup=obj.ID`.
+
+    """
+    url = admin_url("admin:tirtha_contribution_changelist")
+    return format_html(
+        '<a href="{}?{}={}">View all {} contributions</a>', url, lookup, obj.ID, count
+    )
 
 
 class ContributionsInline(admin.TabularInline):
+    @admin.display(description="Contribution Timestamp")
     def contribution_ts(self, obj):
         return obj.contributed_at
 
-    contribution_ts.short_description = "Contribution Timestamp"
-
+    @admin.display(description="Link to Contribution")
     def contribution_link(self, obj):
-        url = reverse("admin:tirtha_contribution_change", args=[obj.ID])
-        return mark_safe(f'<a href="{url}">{obj.ID}</a>')
+        url = admin_url("admin:tirtha_contribution_change", obj.ID)
+        return format_html('<a href="{}">{}</a>', url, obj.ID)
 
-    contribution_link.short_description = "Link to Contribution"
+    def has_add_permission(self, request, obj=None):
+        # NOTE: Contributions are only added via the web interface
+        return False
 
     model = Contribution
+    formset = LimitedInlineFormSet
     readonly_fields = ("contribution_ts", "contribution_link", "processed")
     fields = ("ID", "contribution_ts", "contribution_link", "processed")
     extra = 0
@@ -27,20 +274,30 @@ class ContributionsInline(admin.TabularInline):
 
 
 class ContributionInlineMesh(ContributionsInline):
+    @admin.display(description="Contributor Email")
     def contributor_email(self, obj):
         return obj.contributor.email
 
-    contributor_email.short_description = "Contributor Email"
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.select_related("contributor").only(
+            "ID", "contributed_at", "processed", "mesh", "contributor__email"
+        )
 
     readonly_fields = ContributionsInline.readonly_fields + ("contributor_email",)
     fields = ContributionsInline.fields + ("contributor_email",)
 
 
 class ContributionInlineContributor(ContributionsInline):
+    @admin.display(description="Mesh ID (Verbose)")
     def mesh_id(self, obj):
         return obj.mesh.verbose_id
 
-    mesh_id.short_description = "Mesh ID (Verbose)"
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.select_related("mesh").only(
+            "ID", "contributed_at", "processed", "contributor", "mesh__verbose_id"
+        )
 
     readonly_fields = ContributionsInline.readonly_fields + ("mesh_id",)
     fields = ContributionsInline.fields + ("mesh_id",)
@@ -56,93 +313,69 @@ class RunInlineMesh(admin.TabularInline):
 
 
 @admin.register(Mesh)
-class MeshAdmin(admin.ModelAdmin):
+class MeshAdmin(OnlyFieldsAdmin):
+    @admin.display(description="Preview")
     def get_preview(self, obj):
-        return mark_safe(
-            f'<img src="{obj.preview.url}" alt="{str(obj.verbose_id)}" style="width: 400px; height: 400px">'
-        )
-
-    get_preview.short_description = "Preview"
+        return img_tag(obj.preview.url, obj.verbose_id)
 
+    @admin.display(description="Thumbnail")
     def get_thumbnail(self, obj):
-        return mark_safe(
-            f'<img src="{obj.thumbnail.url}" alt="{str(obj.verbose_id)}" style="width: 400px; height: 400px">'
-        )
-
-    get_thumbnail.short_description = "Thumbnail"
+        return img_tag(obj.thumbnail.url, obj.verbose_id)
 
+    @admin.display(description="ID (Verbose)")
     def mesh_id_verbose(self, obj):
         return obj.verbose_id
 
-    mesh_id_verbose.short_description = "ID (Verbose)"
-
+    @admin.display(description="Contribution Count", ordering="contrib_count_cache")
     def contrib_count(self, obj):
-        return obj.contributions.count()
+        return obj.contrib_count_cache
 
-    contrib_count.short_description = "Contribution Count"
+    @admin.display(description="All Contributions")
+    def get_contributions_link(self, obj):
+        return contributions_link("mesh__ID__exact", obj, obj.contrib_count_cache)
 
+    @admin.display(description="Total Image Count", ordering="image_count_cache")
     def image_count(self, obj):
-        return Image.objects.filter(contribution__mesh=obj).count()
+        return obj.image_count_cache
 
-    image_count.short_description = "Total Image Count"
-
-    @admin.action(description="Mark selected meshes as completed")
-    def mark_completed(self, request, queryset):
-        updated = queryset.update(completed=True)
-        self.message_user(
-            request,
-            ngettext(
+    actions = [
+        bulk_update_action(
+            "mark_completed",
+            "Mark selected meshes as completed",
+            ngettext_lazy(
                 "%d mesh was successfully marked as completed.",
                 "%d meshes were successfully marked as completed.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Mark selected meshes as incomplete")
-    def mark_incomplete(self, request, queryset):
-        updated = queryset.update(completed=False)
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            completed=True,
+        ),
+        bulk_update_action(
+            "mark_incomplete",
+            "Mark selected meshes as incomplete",
+            ngettext_lazy(
                 "%d mesh was successfully marked as incomplete.",
                 "%d meshes were successfully marked as incomplete.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Mark selected meshes as hidden")
-    def mark_hidden(self, request, queryset):
-        updated = queryset.update(hidden=True)
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            completed=False,
+        ),
+        bulk_update_action(
+            "mark_hidden",
+            "Mark selected meshes as hidden",
+            ngettext_lazy(
                 "%d mesh was successfully marked as hidden.",
                 "%d meshes were successfully marked as hidden.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Mark selected meshes as not hidden")
-    def mark_not_hidden(self, request, queryset):
-        updated = queryset.update(hidden=False)
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            hidden=True,
+        ),
+        bulk_update_action(
+            "mark_not_hidden",
+            "Mark selected meshes as not hidden",
+            ngettext_lazy(
                 "%d mesh was successfully marked as not hidden.",
                 "%d meshes were successfully marked as not hidden.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    actions = [mark_completed, mark_incomplete, mark_hidden, mark_not_hidden]
+            ),
+            hidden=False,
+        ),
+    ]
     fieldsets = (
         (
             "Mesh Details",
@@ -163,6 +396,7 @@ class MeshAdmin(admin.ModelAdmin):
                     ),  # Mimicking <model-viewer> attributes (ZXY)
                     ("thumbnail", "get_thumbnail"),
                     ("preview", "get_preview"),
+                    "get_contributions_link",
                 )
             },
         ),
@@ -175,12 +409,14 @@ class MeshAdmin(admin.ModelAdmin):
         "reconstructed_at",
         "get_preview",
         "get_thumbnail",
+        "get_contributions_link",
     )
     list_filter = (
         "status",
         "completed",
         "hidden",
     )
+    search_fields = ("verbose_id", "name")
     list_display = (
         "ID",
         "mesh_id_verbose",
@@ -194,54 +430,62 @@ class MeshAdmin(admin.ModelAdmin):
         "get_thumbnail",
     )
     list_per_page = 25
+    list_only_fields = (
+        "ID",
+        "verbose_id",
+        "name",
+        "reconstructed_at",
+        "status",
+        "completed",
+        "hidden",
+        "thumbnail",
+        "contrib_count_cache",
+        "image_count_cache",
+    )
     inlines = [ContributionInlineMesh]  # , RunInlineMesh FIXME: Error while saving
 
 
 @admin.register(Contributor)
-class ContributorAdmin(admin.ModelAdmin):
+class ContributorAdmin(OnlyFieldsAdmin):
+    @admin.display(description="Contribution Count", ordering="contrib_count_cache")
     def contrib_count(self, obj):
-        return obj.contributions.count()
+        return obj.contrib_count_cache
 
-    contrib_count.short_description = "Contribution Count"
+    @admin.display(description="All Contributions")
+    def get_contributions_link(self, obj):
+        return contributions_link(
+            "contributor__ID__exact", obj, obj.contrib_count_cache
+        )
 
+    @admin.display(description="Total Image Count", ordering="image_count_cache")
     def image_count(self, obj):
-        return Image.objects.filter(contribution__contributor=obj).count()
-
-    image_count.short_description = "Total Image Count"
+        return obj.image_count_cache
 
-    @admin.action(description="Ban selected contributors")
-    def ban_contributors(self, request, queryset):
-        updated = queryset.update(banned=True)
-        self.message_user(
-            request,
-            ngettext(
+    actions = [
+        bulk_update_action(
+            "ban_contributors",
+            "Ban selected contributors",
+            ngettext_lazy(
                 "%d contributor was successfully banned.",
                 "%d contributors were successfully banned.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Unban selected contributors")
-    def unban_contributors(self, request, queryset):
-        updated = queryset.update(banned=False)
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            banned=True,
+        ),
+        bulk_update_action(
+            "unban_contributors",
+            "Unban selected contributors",
+            ngettext_lazy(
                 "%d contributor was successfully unbanned.",
                 "%d contributors were successfully unbanned.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    actions = [ban_contributors, unban_contributors]
+            ),
+            banned=False,
+        ),
+    ]
     readonly_fields = (
         "ID",
         "created_at",
         "updated_at",
+        "get_contributions_link",
     )
     fieldsets = (
         (
@@ -253,12 +497,14 @@ class ContributorAdmin(admin.ModelAdmin):
                     ("name", "email"),
                     "banned",
                     "ban_reason",
+                    "get_contributions_link",
                 )
             },
         ),
     )
     inlines = [ContributionInlineContributor]
     list_filter = ("banned",)
+    search_fields = ("email", "name")
     list_display = (
         "ID",
         "name",
@@ -269,6 +515,15 @@ class ContributorAdmin(admin.ModelAdmin):
         "banned",
     )
     list_per_page = 50
+    list_only_fields = (
+        "ID",
+        "name",
+        "email",
+        "updated_at",
+        "banned",
+        "contrib_count_cache",
+        "image_count_cache",
+    )
 
 
 class ImageInlineContribution(admin.TabularInline):
@@ -277,18 +532,22 @@ class ImageInlineContribution(admin.TabularInline):
 
     """
 
+    @admin.display(description="Preview")
     def get_image(self, obj):
-        return mark_safe(
-            f'<img src="{obj.image.url}" style="width: 400px; height: 400px">'
-        )
-
-    get_image.short_description = "Preview"
+        return img_tag(obj.image.url)
 
+    @admin.display(description="Link to Image")
     def image_link(self, obj):
-        url = reverse("admin:tirtha_image_change", args=[obj.ID])
-        return mark_safe(f'<a href="{url}">{obj.ID}</a>')
+        url = admin_url("admin:tirtha_image_change", obj.ID)
+        return format_html('<a href="{}">{}</a>', url, obj.ID)
 
-    image_link.short_description = "Link to Image"
+    def has_add_permission(self, request, obj=None):
+        # NOTE: Images are only added via the web interface
+        return False
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.only("ID", "contribution", "image")
 
     model = Image
     readonly_fields = ("get_image", "image_link")
@@ -303,21 +562,23 @@ class ImageInlineContribution(admin.TabularInline):
 
 
 @admin.register(Contribution)
-class ContributionAdmin(admin.ModelAdmin):
+class ContributionAdmin(OnlyFieldsAdmin):
+    @admin.display(description="Mesh ID (Verbose)")
     def mesh_id_verbose(self, obj):
         return obj.mesh.verbose_id
 
-    mesh_id_verbose.short_description = "Mesh ID (Verbose)"
-
+    @admin.display(description="Image Count", ordering="image_count_cache")
     def image_count(self, obj):
-        return obj.images.count()
-
-    image_count.short_description = "Image Count"
+        return obj.image_count_cache
 
+    @admin.display(description="Good Image Count", ordering="good_image_count_cache")
     def images_good_count(self, obj):
-        return obj.images.filter(label="good").count()
+        return obj.good_image_count_cache
 
-    images_good_count.short_description = "Good Image Count"
+    def get_queryset(self, request):
+        # NOTE: Mesh & contributor are joined to avoid per-row queries
+        qs = super().get_queryset(request)
+        return qs.select_related("mesh", "contributor")
 
     readonly_fields = (
         "ID",
@@ -343,6 +604,7 @@ class ContributionAdmin(admin.ModelAdmin):
         "processed",
         "mesh",
     )
+    search_fields = ("ID",)
     list_display = (
         "ID",
         "contributed_at",
@@ -353,82 +615,95 @@ class ContributionAdmin(admin.ModelAdmin):
         "processed",
     )
     list_per_page = 50
+    list_select_related = ("mesh", "contributor")
+    list_only_fields = (
+        "ID",
+        "contributed_at",
+        "processed",
+        "image_count_cache",
+        "good_image_count_cache",
+        "mesh__verbose_id",
+        "contributor__email",
+    )
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
     inlines = [
         ImageInlineContribution,
     ]
 
 
 @admin.register(Image)
-class ImageAdmin(admin.ModelAdmin):
+class ImageAdmin(OnlyFieldsAdmin):
     def note(self, obj):
         return (
             "PLEASE USE THE WEB INTERFACE TO ADD IMAGES.\nALSO, USE `Label` FOR MANUAL MODERATION.\n"
             + "ADD A REMARK IN `Remark` IF YOU ARE MANUALLY CHANGING THE LABEL."
         )
 
+    @admin.display(description="Preview")
     def get_thumbnail(self, obj):
-        return mark_safe(
-            f'<img src="{obj.image.url}" style="width: 400px; height: 400px">'
-        )
-
-    get_thumbnail.short_description = "Preview"
+        return img_tag(obj.image.url)
 
+    @admin.display(description="Mesh ID (Verbose)")
     def get_mesh_id_verbose(self, obj):
         return obj.contribution.mesh.verbose_id
 
-    get_mesh_id_verbose.short_description = "Mesh ID (Verbose)"
-
+    @admin.display(description="Link to Contributor")
     def get_contributor_link(self, obj):
-        url = reverse(
-            "admin:tirtha_contributor_change", args=[obj.contribution.contributor.ID]
+        url = admin_url(
+            "admin:tirtha_contributor_change", obj.contribution.contributor.ID
+        )
+        return format_html(
+            '<a href="{}">{}</a>', url, obj.contribution.contributor.name
         )
-        return mark_safe(f'<a href="{url}">{obj.contribution.contributor.name}</a>')
 
-    get_contributor_link.short_description = "Link to Contributor"
+    def get_queryset(self, request):
+        # NOTE: Also used by `get_object`, so the change view benefits too
+        qs = super().get_queryset(request)
+        return qs.select_related("contribution__mesh", "contribution__contributor")
 
-    @admin.action(description="Mark selected images as Good")
-    def mark_good(self, request, queryset):
-        updated = queryset.update(label="good")
-        self.message_user(
-            request,
-            ngettext(
+    def update_with_counts(self, queryset, **fields):
+        # NOTE: QuerySet.update() skips signals, so the good image counts
+        # of the affected contributions are refreshed here
+        contributions = Contribution.objects.filter(
+            pk__in=list(queryset.values_list("contribution", flat=True).distinct())
+        )
+        updated = queryset.update(**fields)
+        refresh_count_caches(contributions=contributions)
+        return updated
+
+    actions = [
+        bulk_update_action(
+            "mark_good",
+            "Mark selected images as Good",
+            ngettext_lazy(
                 "%d image was successfully marked as Good.",
                 "%d images were successfully marked as Good.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Mark selected images as Bad")
-    def mark_bad(self, request, queryset):
-        updated = queryset.update(label="bad")
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            update=update_with_counts,
+            label="good",
+        ),
+        bulk_update_action(
+            "mark_bad",
+            "Mark selected images as Bad",
+            ngettext_lazy(
                 "%d image was successfully marked as Bad.",
                 "%d images were successfully marked as Bad.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    @admin.action(description="Mark selected images as NSFW")
-    def mark_nsfw(self, request, queryset):
-        updated = queryset.update(label="nsfw")
-        self.message_user(
-            request,
-            ngettext(
+            ),
+            update=update_with_counts,
+            label="bad",
+        ),
+        bulk_update_action(
+            "mark_nsfw",
+            "Mark selected images as NSFW",
+            ngettext_lazy(
                 "%d image was successfully marked as NSFW.",
                 "%d images were successfully marked as NSFW.",
-                updated,
-            )
-            % updated,
-            messages.SUCCESS,
-        )
-
-    actions = [mark_good, mark_bad, mark_nsfw]
+            ),
+            update=update_with_counts,
+            label="nsfw",
+        ),
+    ]
     readonly_fields = (
         "ID",
         "contribution",
@@ -460,6 +735,13 @@ class ImageAdmin(admin.ModelAdmin):
     list_filter = ("label",)
     list_display = ("ID", "created_at", "contribution", "label", "get_thumbnail")
     list_per_page = 100
+    list_only_fields = ("ID", "created_at", "label", "image", "contribution__ID")
+    list_select_related = ("contribution",)
+    paginator = ApproxCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
 
 
 class ImageInlineRun(admin.TabularInline):
@@ -469,6 +751,7 @@ class ImageInlineRun(admin.TabularInline):
     """
 
     model = Run.images.through
+    raw_id_fields = ("image",)
     extra = 0
 
 
@@ -479,20 +762,30 @@ class ContributorInlineRun(admin.TabularInline):
     """
 
     model = Run.contributors.through
+    autocomplete_fields = ("contributor",)
     extra = 0
 
 
 @admin.register(Run)
-class RunAdmin(admin.ModelAdmin):
+class RunAdmin(OnlyFieldsAdmin):
+    @admin.display(description="Mesh ID (Verbose)", ordering="mesh__verbose_id")
     def mesh_id_verbose(self, obj):
         return obj.mesh.verbose_id
 
-    mesh_id_verbose.short_description = "Mesh ID (Verbose)"
-
+    @admin.display(description="Image Count", ordering="image_count_cache")
     def image_count(self, obj):
-        return obj.images.count()
+        return obj.image_count_cache
+
+    def get_queryset(self, request):
+        # NOTE: Mesh is joined to avoid per-row queries
+        qs = super().get_queryset(request)
+        return qs.select_related("mesh")
 
-    image_count.short_description = "Image Count"
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # NOTE: `ImageInlineRun` saves & deletes `Run.images.through` rows directly,
+        # which sends no signals (auto-created model), so the run is recounted here
+        refresh_count_caches(runs=Run.objects.filter(pk=form.instance.pk))
 
     readonly_fields = (
         "ID",
@@ -535,25 +828,36 @@ class RunAdmin(admin.ModelAdmin):
         "ark",
     )
     list_per_page = 50
+    list_select_related = ("mesh", "ark")
+    list_only_fields = (
+        "ID",
+        "status",
+        "started_at",
+        "image_count_cache",
+        "mesh__verbose_id",
+        "ark__ark",
+    )
     inlines = [ImageInlineRun, ContributorInlineRun]
 
 
 @admin.register(ARK)
-class ARKAdmin(admin.ModelAdmin):
+class ARKAdmin(OnlyFieldsAdmin):
+    @admin.display(description="Mesh ID (Verbose)")
     def mesh_id_verbose(self, obj):
         return obj.run.mesh.verbose_id
 
-    mesh_id_verbose.short_description = "Mesh ID (Verbose)"
-
+    @admin.display(description="Run")
     def get_run(self, obj):
         return obj.run
 
-    get_run.short_description = "Run"
-
+    @admin.display(description="Total Image Count", ordering="run__image_count_cache")
     def image_count(self, obj):
-        return obj.run.images.count()
+        return obj.run.image_count_cache
 
-    image_count.short_description = "Total Image Count"
+    def get_queryset(self, request):
+        # NOTE: Run & mesh are joined to avoid per-row queries
+        qs = super().get_queryset(request)
+        return qs.select_related("run__mesh")
 
     readonly_fields = (
         "ark",
@@ -587,3 +891,6 @@ class ARKAdmin(admin.ModelAdmin):
     )
     list_display = ("ark", "mesh_id_verbose", "get_run", "created_at", "image_count")
     list_per_page = 50
+    list_select_related = ("run__mesh",)
+    # NOTE: Deferring fields across the reverse `run` relation is not supported
+    list_only_fields = ("ark", "created_at")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+# Local imports
+from tirtha.models import Contribution, Contributor, Mesh, Run, refresh_count_caches
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the denormalized `*_count_cache` columns shown in the admin. "
+        "Run once after adding the columns, or to resync them."
+    )
+
+    def handle(self, *args, **options):
+        refresh_count_caches(
+            meshes=Mesh.objects.all(),
+            contributors=Contributor.objects.all(),
+            contributions=Contribution.objects.all(),
+            runs=Run.objects.all(),
+        )
+        self.stdout.write(self.style.SUCCESS("Refreshed the count caches."))
@@ -3,6 +3,8 @@ import uuid
 from datetime import datetime
 
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from PIL import Image as PILImage
 from PIL import ImageOps
 from shortuuid.django_fields import ShortUUIDField
@@ -32,7 +34,37 @@ def set_thumbnail(obj, filename):
     return os.path.join(upload_to, filename)
 
 
-class Mesh(models.Model):
+class CountCacheModel(models.Model):
+    """
+    Base for models with denormalized `*_count_cache` columns, used by the admin.
+    NOTE: These columns are only written to via `QuerySet.update()` (see `signals.py`
+    & `refresh_count_caches`), so `save()` leaves them out when updating an existing
+    row, to avoid overwriting them with stale in-memory values.
+
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key
+                and not f.name.endswith("_count_cache")
+                and f.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+
+class Mesh(CountCacheModel):
     # Short for ease of use
     ID = ShortUUIDField(
         primary_key=True, length=16, max_length=16, verbose_name="Mesh ID"
@@ -118,9 +150,26 @@ class Mesh(models.Model):
         "Last reconstructed at", blank=True, null=True
     )
 
+    # Denormalized counts - Maintained by signals
+    contrib_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Contribution Count"
+    )
+    image_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Total Image Count"
+    )
+
     class Meta:
         ordering = ["-updated_at"]
         verbose_name_plural = "Meshes"
+        # NOTE: Back the admin's `list_filter`s & ordering
+        indexes = [
+            models.Index(fields=["status", "completed", "hidden"]),
+            models.Index(
+                fields=["hidden"],
+                condition=Q(hidden=True),
+                name="tirtha_mesh_hidden_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.verbose_id
@@ -175,7 +224,7 @@ class Mesh(models.Model):
             super().save(*args, **kwargs)
 
 
-class Contributor(models.Model):
+class Contributor(CountCacheModel):
     ID = models.UUIDField(
         primary_key=True, default=uuid.uuid4, verbose_name="Contributor ID"
     )
@@ -192,9 +241,24 @@ class Contributor(models.Model):
     banned = models.BooleanField(default=False, verbose_name="Banned?")
     ban_reason = models.TextField(blank=True, verbose_name="Ban Reason")
 
+    # Denormalized counts - Maintained by signals
+    contrib_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Contribution Count"
+    )
+    image_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Total Image Count"
+    )
+
     class Meta:
         ordering = ["name"]
         verbose_name_plural = "Contributors"
+        indexes = [
+            models.Index(
+                fields=["banned"],
+                condition=Q(banned=True),
+                name="tirtha_contributor_banned_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.email
@@ -213,7 +277,7 @@ class Contributor(models.Model):
                 """
 
 
-class Contribution(models.Model):
+class Contribution(CountCacheModel):
     ID = models.UUIDField(
         primary_key=True, default=uuid.uuid4, verbose_name="Contribution ID"
     )
@@ -237,9 +301,21 @@ class Contribution(models.Model):
         blank=True, null=True, verbose_name="Processed Timestamp"
     )
 
+    # Denormalized counts - Maintained by signals
+    image_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Image Count"
+    )
+    good_image_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Good Image Count"
+    )
+
     class Meta:
         ordering = ["-contributed_at"]
         verbose_name_plural = "Contributions"
+        indexes = [
+            models.Index(fields=["processed", "mesh"]),
+            models.Index(fields=["-contributed_at"]),
+        ]
 
     def __str__(self):
         return f"{self.ID}"
@@ -280,6 +356,15 @@ class Image(models.Model):
     class Meta:
         ordering = ["-created_at"]
         verbose_name_plural = "Images"
+        indexes = [
+            models.Index(fields=["label"]),
+            # NOTE: Covers the keyset pagination in the admin (see `KeysetChangeList`)
+            models.Index(
+                fields=["-created_at", "-ID"],
+                include=["label", "contribution"],
+                name="tirtha_image_keyset_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.ID}"
@@ -347,7 +432,7 @@ class ARK(models.Model):
         super().save(*args, **kwargs)
 
 
-class Run(models.Model):
+class Run(CountCacheModel):
     ID = ShortUUIDField(
         primary_key=True, length=16, max_length=16, verbose_name="Run ID"
     )
@@ -396,9 +481,17 @@ class Run(models.Model):
         default=0, null=True, verbose_name="Rotation about Z-axis"
     )
 
+    # Denormalized count - Maintained by signals
+    image_count_cache = models.IntegerField(
+        default=0, editable=False, verbose_name="Image Count"
+    )
+
     class Meta:
         ordering = ["-started_at"]
         verbose_name_plural = "Runs"
+        indexes = [
+            models.Index(fields=["status"]),
+        ]
 
     def __str__(self):
         return f"{self.ID}"
@@ -421,3 +514,51 @@ class Run(models.Model):
         if not self.directory:
             self.directory = f"{self.mesh.ID}/cache/{self.started_at.strftime('%Y-%m-%d-%H-%M-%S')}__{str(self.ID)}"
         super().save(update_fields=["directory"])
+
+
+def count_subquery(qs, ref):
+    """
+    Correlated `COUNT` subquery over `qs`, grouped on the `ref` lookup.
+
+    """
+    counts = (
+        qs.filter(**{ref: OuterRef("pk")})
+        .order_by()
+        .values(ref)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def refresh_count_caches(meshes=None, contributors=None, contributions=None, runs=None):
+    """
+    Recomputes the `*_count_cache` columns of the given querysets from scratch.
+    Used after operations that bypass signals (`bulk_create()`, `QuerySet.update()`)
+    & by `manage.py refresh_count_caches`, to backfill the columns.
+
+    """
+    images = Image.objects.all()
+    if meshes is not None:
+        meshes.update(
+            contrib_count_cache=count_subquery(Contribution.objects.all(), "mesh"),
+            image_count_cache=count_subquery(images, "contribution__mesh"),
+        )
+    if contributors is not None:
+        contributors.update(
+            contrib_count_cache=count_subquery(
+                Contribution.objects.all(), "contributor"
+            ),
+            image_count_cache=count_subquery(images, "contribution__contributor"),
+        )
+    if contributions is not None:
+        contributions.update(
+            image_count_cache=count_subquery(images, "contribution"),
+            good_image_count_cache=count_subquery(
+                images.filter(label="good"), "contribution"
+            ),
+        )
+    if runs is not None:
+        runs.update(
+            image_count_cache=count_subquery(Run.images.through.objects.all(), "run")
+        )
@@ -1,12 +1,28 @@
 import shutil
+import weakref
 from pathlib import Path
 
 from django.conf import settings
-from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.db.models import F, Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
 # Local imports
-from .models import Contribution, Contributor, Image, Mesh, Run
+from .models import (
+    Contribution,
+    Contributor,
+    Image,
+    Mesh,
+    Run,
+    refresh_count_caches,
+)
 
 STATIC = Path(settings.STATIC_ROOT)
 MEDIA = Path(settings.MEDIA_ROOT)
@@ -24,8 +40,8 @@ def post_migrate_create_defaults(sender, **kwargs):
     """
     if (
         sender.name == "tirtha"
-        and Mesh.objects.count() == 0
-        and Contributor.objects.count() == 0
+        and not Mesh.objects.exists()
+        and not Contributor.objects.exists()
     ):
         mesh_ID = DEFAULT_MESH_ID
 
@@ -118,6 +134,180 @@ def post_del_image(sender, instance, **kwargs):
     Contribution.objects.filter(images__isnull=True).delete()
 
 
+@receiver(post_save, sender=Contribution)
+def post_save_contribution(sender, instance, created, **kwargs):
+    """
+    Updates the contribution counts of the mesh & contributor.
+
+    """
+    if created:
+        Mesh.objects.filter(pk=instance.mesh_id).update(
+            contrib_count_cache=F("contrib_count_cache") + 1
+        )
+        Contributor.objects.filter(pk=instance.contributor_id).update(
+            contrib_count_cache=F("contrib_count_cache") + 1
+        )
+
+
+def _update_image_counts(image, delta, good_delta=0):
+    """
+    Updates the image counts of the image's contribution, mesh & contributor.
+
+    """
+    Contribution.objects.filter(pk=image.contribution_id).update(
+        image_count_cache=F("image_count_cache") + delta,
+        good_image_count_cache=F("good_image_count_cache") + good_delta,
+    )
+    Mesh.objects.filter(contributions=image.contribution_id).update(
+        image_count_cache=F("image_count_cache") + delta
+    )
+    Contributor.objects.filter(contributions=image.contribution_id).update(
+        image_count_cache=F("image_count_cache") + delta
+    )
+
+
+@receiver(post_save, sender=Image)
+def post_save_image(sender, instance, created, **kwargs):
+    """
+    Updates the image counts, when an `Image` is created or its label is changed.
+    NOTE: `bulk_create()` & `QuerySet.update()` skip this - use `refresh_count_caches`.
+
+    """
+    is_good = instance.label == "good"
+    if created:
+        _update_image_counts(instance, 1, int(is_good))
+    elif is_good != (getattr(instance, "_old_label", instance.label) == "good"):
+        Contribution.objects.filter(pk=instance.contribution_id).update(
+            good_image_count_cache=F("good_image_count_cache") + (1 if is_good else -1)
+        )
+
+
+# Counts to recompute once a delete is done, per deletion `origin`
+_delete_batches = {}
+
+
+def _delete_batch(origin):
+    """
+    Returns the pending recounts of the delete started from `origin`.
+    NOTE: A delete sends `pre_delete` for all its objects before deleting any & then
+    `post_delete` for each, so the counts are recomputed once, after the last one,
+    instead of per object. Nested deletes (see `post_del_image`) have their own
+    `origin`, so they are recounted on their own.
+
+    """
+    batch = _delete_batches.get(id(origin))
+    if batch is None or batch["origin"]() is not origin:
+        # Drops the batches of deletes that failed midway
+        for key, stale in list(_delete_batches.items()):
+            if stale["origin"]() is None:
+                _delete_batches.pop(key, None)
+        batch = _delete_batches[id(origin)] = {
+            "origin": weakref.ref(origin),
+            "pending": 0,
+            "meshes": set(),
+            "contributors": set(),
+            "contributions": set(),
+            "runs": set(),
+        }
+    return batch
+
+
+def _end_delete(origin):
+    """
+    Recounts the objects affected by the delete, after its last `post_delete`.
+
+    """
+    batch = _delete_batch(origin)
+    batch["pending"] -= 1
+    if batch["pending"] > 0:
+        return
+    del _delete_batches[id(origin)]
+
+    # NOTE: Meshes & contributors of deleted contributions were collected in
+    # `pre_del_contribution`, the rest are found via the remaining contributions
+    contributions = batch["contributions"]
+    refresh_count_caches(
+        meshes=Mesh.objects.filter(
+            Q(pk__in=batch["meshes"]) | Q(contributions__in=contributions)
+        ),
+        contributors=Contributor.objects.filter(
+            Q(pk__in=batch["contributors"]) | Q(contributions__in=contributions)
+        ),
+        contributions=Contribution.objects.filter(pk__in=contributions),
+        runs=Run.objects.filter(pk__in=batch["runs"]),
+    )
+
+
+@receiver(pre_delete, sender=Contribution)
+def pre_del_contribution(sender, instance, origin, **kwargs):
+    """
+    Collects the mesh & contributor, to update their counts after the delete.
+
+    """
+    batch = _delete_batch(origin)
+    batch["pending"] += 1
+    batch["meshes"].add(instance.mesh_id)
+    batch["contributors"].add(instance.contributor_id)
+
+
+@receiver(post_delete, sender=Contribution)
+def post_del_contribution(sender, instance, origin, **kwargs):
+    """
+    Updates the counts of the mesh & contributor, once the delete is done.
+    NOTE: `post_del_image` can delete a contribution that is already being deleted,
+    sending `post_delete` twice - but only once per `origin`.
+
+    """
+    _end_delete(origin)
+
+
+@receiver(pre_delete, sender=Image)
+def pre_del_image(sender, instance, origin, **kwargs):
+    """
+    Collects the contribution & runs, before the run links are deleted.
+    NOTE: Runs are looked up once per contribution, not per image.
+
+    """
+    batch = _delete_batch(origin)
+    batch["pending"] += 1
+    if instance.contribution_id not in batch["contributions"]:
+        batch["contributions"].add(instance.contribution_id)
+        batch["runs"].update(
+            Run.objects.filter(images__contribution=instance.contribution_id)
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+
+
+@receiver(post_delete, sender=Image)
+def post_del_image_counts(sender, instance, origin, **kwargs):
+    """
+    Updates the image counts, once the delete is done.
+
+    """
+    _end_delete(origin)
+
+
+@receiver(m2m_changed, sender=Run.images.through)
+def m2m_changed_run_images(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Updates the image counts of the affected runs.
+
+    """
+    if reverse and action == "pre_clear":  # Runs are not passed on clear
+        instance._cleared_run_ids = list(instance.runs.values_list("pk", flat=True))
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        run_ids = [instance.pk]
+    elif action == "post_clear":
+        run_ids = getattr(instance, "_cleared_run_ids", [])
+    else:
+        run_ids = pk_set
+    refresh_count_caches(runs=Run.objects.filter(pk__in=run_ids))
+
+
 @receiver(pre_save, sender=Image)
 def pre_save_image(sender, instance, **kwargs):
     """
@@ -126,6 +316,7 @@ def pre_save_image(sender, instance, **kwargs):
     """
     if instance.pk:
         old_instance = Image.objects.get(pk=instance.pk)
+        instance._old_label = old_instance.label  # Used by `post_save_image`
 
         if instance.label != old_instance.label:
             image_root = f"models/{instance.contribution.mesh.ID}/images/"
@@ -1,4 +1,350 @@
-# LATE_EXP: TODO:
-from django.test import TestCase
+import shutil
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count, Q
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import signals
+from .admin import ImageAdmin
+from .models import Contribution, Contributor, Image, Mesh, Run, refresh_count_caches
+
+
+class TirthaTestCase(TestCase):
+    """
+    Base for tests that write to the DB. The folders that the signals create for
+    meshes, images & runs are kept in a temporary directory.
+
+    """
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+        self.media = Path(tmp) / "media"
+        for patcher in (
+            mock.patch.object(signals, "MEDIA", self.media),
+            mock.patch.object(signals, "STATIC", Path(tmp) / "static"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        media_root = override_settings(MEDIA_ROOT=str(self.media))
+        media_root.enable()
+        self.addCleanup(media_root.disable)
+
+        self.user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(self.user)
+
+    def make_mesh(self, name="mesh"):
+        return Mesh.objects.create(name=name)
+
+    def make_contributor(self, name="contributor"):
+        return Contributor.objects.create(name=name, email=f"{name}@example.com")
+
+    def make_images(self, contribution, *labels):
+        """
+        Creates an image (& its file) in `contribution` for each of `labels`,
+        the same way as the `upload` view.
+
+        """
+        images = []
+        for label in labels:
+            image = Image(contribution=contribution, label=label)
+            image.image.name = (
+                f"models/{contribution.mesh_id}/images/{label}/{image.ID}.jpg"
+                if label
+                else f"models/{contribution.mesh_id}/images/{image.ID}.jpg"
+            )
+            path = self.media / image.image.name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+            images.append(image)
+        Image.objects.bulk_create(images)
+        refresh_count_caches(
+            meshes=Mesh.objects.filter(pk=contribution.mesh_id),
+            contributors=Contributor.objects.filter(pk=contribution.contributor_id),
+            contributions=Contribution.objects.filter(pk=contribution.pk),
+        )
+        return images
+
+
+class CountCacheTests(TirthaTestCase):
+    """
+    Checks that the `*_count_cache` columns match a fresh `COUNT` after each write.
+
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.mesh = self.make_mesh()
+        self.other_mesh = self.make_mesh("other")
+        self.contributor = self.make_contributor()
+        self.contribution = Contribution.objects.create(
+            mesh=self.mesh, contributor=self.contributor
+        )
+        self.other_contribution = Contribution.objects.create(
+            mesh=self.other_mesh, contributor=self.contributor
+        )
+        self.images = self.make_images(self.contribution, "good", "good", "bad", "")
+        self.other_images = self.make_images(self.other_contribution, "good", "nsfw")
+        self.run = Run.objects.create(mesh=self.mesh)
+        self.run.images.set(self.images + self.other_images[:1])
+
+    def assertCountsInSync(self):
+        meshes = Mesh.objects.annotate(
+            contribs=Count("contributions", distinct=True),
+            images=Count("contributions__images", distinct=True),
+        )
+        for mesh in meshes:
+            self.assertEqual(
+                (mesh.contrib_count_cache, mesh.image_count_cache),
+                (mesh.contribs, mesh.images),
+                f"Mesh {mesh.name}",
+            )
+        contributors = Contributor.objects.annotate(
+            contribs=Count("contributions", distinct=True),
+            images=Count("contributions__images", distinct=True),
+        )
+        for contributor in contributors:
+            self.assertEqual(
+                (contributor.contrib_count_cache, contributor.image_count_cache),
+                (contributor.contribs, contributor.images),
+                f"Contributor {contributor.name}",
+            )
+        contributions = Contribution.objects.annotate(
+            n_images=Count("images"),
+            n_good=Count("images", filter=Q(images__label="good")),
+        )
+        for contribution in contributions:
+            self.assertEqual(
+                (contribution.image_count_cache, contribution.good_image_count_cache),
+                (contribution.n_images, contribution.n_good),
+                f"Contribution {contribution.ID}",
+            )
+        for run in Run.objects.annotate(n_images=Count("images")):
+            self.assertEqual(run.image_count_cache, run.n_images, f"Run {run.ID}")
+
+    def test_create(self):
+        self.assertCountsInSync()
+
+    def test_label_change(self):
+        image = self.images[2]
+        image.label = "good"
+        image.save()
+        self.assertCountsInSync()
+
+        image.label = "nsfw"
+        image.save()
+        self.assertCountsInSync()
+
+    def test_save_leaves_cached_counts(self):
+        stale = Mesh.objects.get(pk=self.mesh.pk)
+        self.make_images(self.contribution, "good")
+        stale.description = "Updated"
+        stale.save()
+        self.assertCountsInSync()
+
+    def test_delete_image(self):
+        self.images[0].delete()
+        self.assertCountsInSync()
+
+        Image.objects.filter(pk__in=[self.images[1].pk, self.images[2].pk]).delete()
+        self.assertCountsInSync()
+
+    def test_delete_last_images_deletes_contribution(self):
+        Image.objects.filter(contribution=self.other_contribution).delete()
+        self.assertFalse(Contribution.objects.filter(pk=self.other_contribution.pk))
+        self.assertCountsInSync()
+
+    def test_delete_contribution(self):
+        self.contribution.delete()
+        self.assertCountsInSync()
+
+    def test_delete_mesh(self):
+        self.other_mesh.delete()
+        self.assertCountsInSync()
+
+    def test_delete_contributor(self):
+        self.make_contributor("other").delete()
+        self.contributor.delete()
+        self.assertCountsInSync()
+
+    def test_delete_updates_do_not_scale_with_images(self):
+        def count_updates(n_images):
+            contribution = Contribution.objects.create(
+                mesh=self.mesh, contributor=self.contributor
+            )
+            self.run.images.add(*self.make_images(contribution, *["good"] * n_images))
+            with CaptureQueriesContext(connection) as ctx:
+                contribution.delete()
+            self.assertCountsInSync()
+            return sum(q["sql"].startswith("UPDATE") for q in ctx.captured_queries)
+
+        self.assertEqual(count_updates(2), count_updates(6))
+
+    def test_run_images_changes(self):
+        image = self.other_images[1]
+        self.run.images.remove(self.images[0])
+        self.assertCountsInSync()
+
+        image.runs.add(self.run)
+        self.assertCountsInSync()
+
+        image.runs.clear()
+        self.assertCountsInSync()
+
+        self.run.images.clear()
+        self.assertCountsInSync()
+
+    def test_refresh_count_caches(self):
+        Image.objects.bulk_create(
+            [Image(contribution=self.contribution, label="good") for _ in range(3)]
+        )
+        Image.objects.filter(pk=self.images[3].pk).update(label="good")
+        Run.images.through.objects.filter(run=self.run).delete()
+        refresh_count_caches(
+            meshes=Mesh.objects.all(),
+            contributors=Contributor.objects.all(),
+            contributions=Contribution.objects.all(),
+            runs=Run.objects.all(),
+        )
+        self.assertCountsInSync()
+
+    def test_refresh_count_caches_command(self):
+        for model in (Mesh, Contributor, Contribution, Run):
+            fields = [f.name for f in model._meta.fields if f.name.endswith("_cache")]
+            model.objects.update(**{field: 0 for field in fields})
+        call_command("refresh_count_caches", stdout=mock.Mock())
+        self.assertCountsInSync()
+
+    def test_admin_label_action(self):
+        response = self.client.post(
+            reverse("admin:tirtha_image_changelist"),
+            {
+                "action": "mark_good",
+                "_selected_action": [str(image.pk) for image in self.images],
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertCountsInSync()
+
+    def test_admin_delete_contribution(self):
+        url = reverse("admin:tirtha_contribution_delete", args=[self.contribution.pk])
+        response = self.client.post(url, {"post": "yes"})
+        self.assertEqual(response.status_code, 302)
+        self.assertCountsInSync()
+
+    def change_form_data(self, url):
+        """
+        Returns the POST data of the admin change form at `url`, as is.
+
+        """
+        response = self.client.get(url)
+        forms = [response.context["adminform"].form]
+        data = {}
+        for inline in response.context["inline_admin_formsets"]:
+            forms += [inline.formset.management_form, *inline.formset.forms]
+        for form in forms:
+            for field in form:
+                value = field.value()
+                if value is not None and value is not False:
+                    data[field.html_name] = value
+        return data
+
+    def test_admin_run_image_inline(self):
+        url = reverse("admin:tirtha_run_change", args=[self.run.pk])
+        data = self.change_form_data(url)
+        prefix = "Run_images-"
+        data[f"{prefix}0-DELETE"] = "on"
+        data[f"{prefix}1-DELETE"] = "on"
+        total = int(data[f"{prefix}TOTAL_FORMS"])
+        data[f"{prefix}TOTAL_FORMS"] = total + 1
+        data[f"{prefix}{total}-run"] = self.run.pk
+        data[f"{prefix}{total}-image"] = self.other_images[1].pk
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.run.images.count(), 4)
+        self.assertCountsInSync()
+
+    def test_admin_contribution_image_inline(self):
+        url = reverse("admin:tirtha_contribution_change", args=[self.contribution.pk])
+        data = self.change_form_data(url)
+        data["images-0-DELETE"] = "on"
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.contribution.images.count(), 3)
+        self.assertCountsInSync()
+
+
+class KeysetPaginationTests(TirthaTestCase):
+    """
+    Checks the "Next" links of the Image changelist (see `KeysetChangeList`).
+
+    """
+
+    def setUp(self):
+        super().setUp()
+        contribution = Contribution.objects.create(
+            mesh=self.make_mesh(), contributor=self.make_contributor()
+        )
+        images = self.make_images(contribution, *["good", "bad", ""] * 8)
+        # NOTE: Groups of rows with tied timestamps, to check the `pk` tie-break
+        now = timezone.now()
+        for i, image in enumerate(images):
+            Image.objects.filter(pk=image.pk).update(
+                created_at=now - timedelta(minutes=i // 5)
+            )
+        self.url = reverse("admin:tirtha_image_changelist")
+        patcher = mock.patch.object(ImageAdmin, "list_per_page", 5)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def walk(self, url):
+        pks = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            changelist = response.context["cl"]
+            pks += [image.pk for image in changelist.result_list]
+            url = changelist.next_cursor_url and self.url + changelist.next_cursor_url
+        return pks
+
+    def test_walk_returns_every_row_once_in_order(self):
+        expected = list(
+            Image.objects.order_by("-created_at", "-pk").values_list("pk", flat=True)
+        )
+        self.assertEqual(self.walk(self.url), expected)
+
+    def test_walk_keeps_filters(self):
+        expected = list(
+            Image.objects.filter(label="good")
+            .order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(self.walk(f"{self.url}?label__exact=good"), expected)
+
+    def test_no_next_link_on_full_last_page(self):
+        response = self.client.get(f"{self.url}?p=4")  # 24 rows
+        self.assertIsNotNone(response.context["cl"].next_cursor_url)
+        oldest = Image.objects.order_by("created_at").values_list("pk", flat=True)
+        Image.objects.filter(pk__in=list(oldest[:4])).delete()  # 20 rows
+
+        response = self.client.get(f"{self.url}?p=4")
+        self.assertEqual(len(response.context["cl"].result_list), 5)
+        self.assertIsNone(response.context["cl"].next_cursor_url)
+
+    def test_malformed_cursor(self):
+        for cursor in ("oops", "2023-01-01T00:00:00|oops"):
+            response = self.client.get(self.url, {"after": cursor})
+            self.assertRedirects(
+                response, f"{self.url}?e=1", fetch_redirect_response=False
+            )
@@ -16,7 +16,15 @@ from google.oauth2 import id_token
 # Local imports
 from tirtha_bk.views import handler403, handler404
 
-from .models import ARK, Contribution, Contributor, Image, Mesh, Run
+from .models import (
+    ARK,
+    Contribution,
+    Contributor,
+    Image,
+    Mesh,
+    Run,
+    refresh_count_caches,
+)
 from .tasks import post_save_contrib_imageops
 from .utilsark import parse_ark
 
@@ -387,6 +395,11 @@ def upload(request):
     # NOTE: bulk_create() is faster than creating one-by-one and does not trigger signals
     # LATE_EXP: Test abulk_create() (async) for performance improvements
     Image.objects.bulk_create(image_objs)
+    refresh_count_caches(  # Since bulk_create() does not trigger signals
+        meshes=Mesh.objects.filter(pk=mesh.pk),
+        contributors=Contributor.objects.filter(pk=contrib.pk),
+        contributions=Contribution.objects.filter(pk=contribution.pk),
+    )
     contribution.save()
     mesh.save()  # Updates mesh.updated_at
     post_save_contrib_imageops.delay(